@@ -300,21 +300,35 @@ if current_rankings:
 # Apply text filters
 current_df = apply_text_filters(current_df, st.session_state.text_filters[st.session_state.current_df])
 
-# Function to calculate effective weight for each column
-def get_effective_weight(column_name):
-    for param_name, param_data in st.session_state.hierarchical_weights.items():
-        if column_name in param_data['sub_params']:
-            param_weight = param_data['weight']
-            sub_weight = param_data['sub_params'][column_name]
-            effective_weight = (param_weight / 100) * (sub_weight / 100) * 100
-            return effective_weight
-    return None
+# Columns used for filtering only and never shown in the table
+HIDDEN_DISPLAY_COLUMNS = ['Highest Phase Completed 5yrs Ago', 'Has at least one rare or ultrarare']
+
+# Function to prepare display columns and their headers once per weight scheme
+@st.cache_data
+def prepare_display_columns(columns, weights):
+    """Return the ordered source columns and their header labels (with effective weights in brackets)"""
+    # Map each sub-parameter to its effective weight in a single pass over the weights
+    effective_weights = {}
+    for param_data in weights.values():
+        for sub_param, sub_weight in param_data['sub_params'].items():
+            effective_weights.setdefault(sub_param, (param_data['weight'] / 100) * (sub_weight / 100) * 100)
+    
+    # Put Final Score first and drop hidden columns
+    ordered_columns = [col for col in columns if col not in HIDDEN_DISPLAY_COLUMNS]
+    if 'FINAL SCORE' in ordered_columns:
+        ordered_columns = ['FINAL SCORE'] + [col for col in ordered_columns if col != 'FINAL SCORE']
+    
+    header_labels = [
+        f"{col} [{effective_weights[col]:.2f}%]" if col in effective_weights else col
+        for col in ordered_columns
+    ]
+    return ordered_columns, header_labels
 
 # Apply filter to dataframe if toggle is on
 if filter_old_phases and 'Highest Phase Completed 5yrs Ago' in current_df.columns:
-    df_to_display = current_df[current_df['Highest Phase Completed 5yrs Ago'] == False].copy()
+    df_to_display = current_df[current_df['Highest Phase Completed 5yrs Ago'] == False]
 else:
-    df_to_display = current_df.copy()
+    df_to_display = current_df
 
 # Active Filters Popover
 with st.sidebar.popover("**Active keywords filters**", icon=":material/filter_list:"):
@@ -370,25 +384,11 @@ except Exception as e:
     # If there's any error loading the logo, show placeholder text
     st.sidebar.markdown("<div style='text-align: center; color: #666;'><em>Alvotech</em></div>", unsafe_allow_html=True)
 
-# Update column names to include weights in brackets
-new_column_names = {}
-for col in df_to_display.columns:
-    effective_weight = get_effective_weight(col)
-    if effective_weight is not None:
-        new_column_names[col] = f"{col} [{effective_weight:.2f}%]"
-    else:
-        new_column_names[col] = col
-
-# Rename columns
-df_to_display = df_to_display.rename(columns=new_column_names)
-
-# Reorder columns to put Final Score first if it exists
-if 'FINAL SCORE' in df_to_display.columns:
-    cols = ['FINAL SCORE'] + [col for col in df_to_display.columns if col != 'FINAL SCORE']
-    df_to_display = df_to_display[cols]
-
-# Remove the 'Highest Phase Completed 5yrs Ago' column from display
-df_to_display = df_to_display[[col for col in df_to_display.columns if col not in ['Highest Phase Completed 5yrs Ago','Has at least one rare or ultrarare']]]
+# Select, reorder and relabel the displayed columns in a single projection
+display_columns, display_labels = prepare_display_columns(
+    tuple(df_to_display.columns), st.session_state.hierarchical_weights
+)
+df_to_display = df_to_display.loc[:, display_columns].set_axis(display_labels, axis=1)
 
 # Display the dataframe only if it's not empty
 if len(df_to_display) > 0: